@@ -7,8 +7,10 @@
 """
 
 import csv
+import heapq
+from operator import attrgetter, itemgetter
 from datetime import datetime
-from config import MEDALS, GAME_CONFIGS
+from config import MEDALS, GAME_CONFIGS, SHOOTER_GAMES
 
 
 # ==============================================================================
@@ -28,6 +30,7 @@ class LeaderboardSystem:
         leaderboard = []
         for rank, p in enumerate(participants, 1):
             entry = {
+                'id': p.id,
                 'rank': rank,
                 'medal': MEDALS.get(rank, ''),
                 'name': p.name,
@@ -70,11 +73,11 @@ class LeaderboardSystem:
     @staticmethod
     def get_mvp_leaderboard(tournament):
         """Get players ranked by MVP count"""
-        all_players = list(tournament.participants.values())
-        sorted_by_mvp = sorted(all_players, key=lambda x: x.mvp_count, reverse=True)
+        # Only the top 10 are shown, no need to sort everyone
+        top_mvps = heapq.nlargest(10, tournament.participants.values(), key=attrgetter('mvp_count'))
         
         mvp_board = []
-        for rank, p in enumerate(sorted_by_mvp[:10], 1):
+        for rank, p in enumerate(top_mvps, 1):
             if p.mvp_count > 0:  # Only show players with at least 1 MVP
                 mvp_board.append({
                     'rank': rank,
@@ -89,18 +92,19 @@ class LeaderboardSystem:
     @staticmethod
     def get_kd_leaderboard(tournament):
         """Get players ranked by K/D ratio (for shooters)"""
-        all_players = [p for p in tournament.participants.values() if p.kills > 0]
-        sorted_by_kd = sorted(all_players, key=lambda x: x.get_kd_ratio(), reverse=True)
+        # Work out each K/D once, then pick the top 10 on the stored value
+        all_players = [(p.get_kd_ratio(), p) for p in tournament.participants.values() if p.kills > 0]
+        top_kd = heapq.nlargest(10, all_players, key=itemgetter(0))
         
         kd_board = []
-        for rank, p in enumerate(sorted_by_kd[:10], 1):
+        for rank, (kd, p) in enumerate(top_kd, 1):
             kd_board.append({
                 'rank': rank,
                 'name': p.name,
                 'team': p.team,
                 'kills': p.kills,
                 'deaths': p.deaths,
-                'kd': p.get_kd_ratio()
+                'kd': kd
             })
         
         return kd_board
@@ -118,24 +122,21 @@ class AnalyticsEngine:
         """Get tournament overview statistics"""
         
         total_participants = len(tournament.participants)
-        active = len([p for p in tournament.participants.values() if p.active])
         total_matches = len(tournament.matches)
-        completed = len([m for m in tournament.matches if m.played])
         
-        # Calculate total goals
-        total_goals = 0
-        for match in tournament.matches:
-            if match.played:
-                total_goals += match.score1 + match.score2
+        # Running totals kept by the tournament, no need to scan the matches
+        completed = tournament.played_count
+        total_goals = tournament.total_score
         
         avg_goals = round(total_goals / completed, 2) if completed > 0 else 0
         
-        # NEW: Count total MVPs awarded
-        mvp_matches = len([m for m in tournament.matches if m.played and m.mvp_id])
-        
-        # NEW: Get tournament MVP (most MVP awards)
-        all_players = list(tournament.participants.values())
-        tournament_mvp = max(all_players, key=lambda x: x.mvp_count) if all_players else None
+        # Tournament MVP (most MVP awards) and MVPs awarded (one per decided match)
+        tournament_mvp = None
+        mvp_matches = 0
+        for p in tournament.participants.values():
+            mvp_matches += p.mvp_count
+            if tournament_mvp is None or p.mvp_count > tournament_mvp.mvp_count:
+                tournament_mvp = p
         
         return {
             'name': tournament.name,
@@ -144,7 +145,7 @@ class AnalyticsEngine:
             'status': 'Finished' if tournament.finished else 'Active',
             'round': tournament.current_round,
             'total_participants': total_participants,
-            'active_participants': active,
+            'active_participants': len(tournament.active_players),
             'total_matches': total_matches,
             'completed_matches': completed,
             'pending_matches': total_matches - completed,
@@ -158,11 +159,10 @@ class AnalyticsEngine:
     def get_top_scorers(tournament, limit=5):
         """Get highest scoring players"""
         
-        all_players = list(tournament.participants.values())
-        sorted_players = sorted(all_players, key=lambda x: x.score_for, reverse=True)
+        top_players = heapq.nlargest(limit, tournament.participants.values(), key=attrgetter('score_for'))
         
         top_scorers = []
-        for i, p in enumerate(sorted_players[:limit], 1):
+        for i, p in enumerate(top_players, 1):
             top_scorers.append({
                 'rank': i,
                 'name': p.name,
@@ -175,8 +175,7 @@ class AnalyticsEngine:
     @staticmethod
     def is_shooter_game(game_name):
         """Check if game is a shooter (for K/D display)"""
-        shooters = ["Valorant", "Counter-Strike 2", "PUBG Mobile"]
-        return game_name in shooters
+        return game_name in SHOOTER_GAMES
     
     @staticmethod
     def export_csv(tournament, filepath):
@@ -194,9 +193,9 @@ class AnalyticsEngine:
                 writer.writerow(['Date', datetime.now().strftime("%Y-%m-%d %H:%M")])
                 writer.writerow([])
                 
-                # Get stats
-                stats = AnalyticsEngine.get_stats(tournament)
-                writer.writerow(['Tournament MVP', stats['tournament_mvp']])
+                # Tournament MVP is the top of the MVP board (built once, reused below)
+                mvp_board = LeaderboardSystem.get_mvp_leaderboard(tournament)
+                writer.writerow(['Tournament MVP', mvp_board[0]['name'] if mvp_board else 'TBD'])
                 writer.writerow([])
                 
                 # Standings header
@@ -222,6 +221,7 @@ class AnalyticsEngine:
                 
                 # Standings data
                 leaderboard = LeaderboardSystem.get_leaderboard(tournament)
+                rows = []
                 for entry in leaderboard:
                     row = [
                         entry['rank'],
@@ -250,17 +250,17 @@ class AnalyticsEngine:
                         row.insert(2, entry['team'])
                         row.insert(3, entry['role'])
                     
-                    writer.writerow(row)
+                    rows.append(row)
+                
+                writer.writerows(rows)
                 
                 # MVP Leaderboard section
                 writer.writerow([])
                 writer.writerow(['MVP LEADERBOARD'])
                 writer.writerow(['Rank', 'Name', 'Team', 'MVP Awards', 'Matches'])
                 
-                mvp_board = LeaderboardSystem.get_mvp_leaderboard(tournament)
-                for entry in mvp_board:
-                    writer.writerow([entry['rank'], entry['name'], entry['team'], 
-                                   entry['mvp_count'], entry['matches']])
+                writer.writerows([entry['rank'], entry['name'], entry['team'], 
+                                  entry['mvp_count'], entry['matches']] for entry in mvp_board)
                 
                 # K/D Leaderboard for shooters
                 if is_shooter:
@@ -269,9 +269,8 @@ class AnalyticsEngine:
                     writer.writerow(['Rank', 'Name', 'Team', 'Kills', 'Deaths', 'K/D'])
                     
                     kd_board = LeaderboardSystem.get_kd_leaderboard(tournament)
-                    for entry in kd_board:
-                        writer.writerow([entry['rank'], entry['name'], entry['team'], 
-                                       entry['kills'], entry['deaths'], entry['kd']])
+                    writer.writerows([entry['rank'], entry['name'], entry['team'], 
+                                      entry['kills'], entry['deaths'], entry['kd']] for entry in kd_board)
             
             return True
             
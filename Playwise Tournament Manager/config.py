@@ -18,6 +18,12 @@ DEFAULT_ELO = 1000
 MIN_PLAYERS = 2
 MAX_PLAYERS = 128
 
+# Swiss pairing: max search steps before falling back to greedy pairing
+SWISS_SEARCH_LIMIT = 20000
+
+# Player sheet: rows built per idle callback (keeps the window responsive)
+SHEET_BATCH_ROWS = 16
+
 # ==============================================================================
 # UI COLORS (Dark Theme)
 # ==============================================================================
@@ -151,6 +157,14 @@ GAME_CONFIGS = {
 # ==============================================================================
 FORMATS = ["League", "Knockout", "Swiss"]
 
+# ==============================================================================
+# SHOOTER GAMES (score = kills, tracked for K/D)
+# ==============================================================================
+SHOOTER_GAMES = frozenset({"Valorant", "Counter-Strike 2", "PUBG Mobile"})
+
+# Games whose matches may end in a draw (built once from GAME_CONFIGS)
+DRAW_GAMES = frozenset(name for name, conf in GAME_CONFIGS.items() if conf['allows_draw'])
+
 # ==============================================================================
 # RANK MEDALS
 # ==============================================================================
@@ -6,12 +6,22 @@
 ╚═══════════════════════════════════════════════════════════════════════════╝
 """
 
+import atexit
 import json
 import uuid
 import os
+import shutil
+import sys
+import threading
 from datetime import datetime
 from config import DATA_FILE, DEFAULT_ELO
 
+# Optional: orjson encodes/decodes much faster, stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ==============================================================================
 # PARTICIPANT CLASS
@@ -20,8 +30,14 @@ from config import DATA_FILE, DEFAULT_ELO
 class Participant:
     """Stores player or team data"""
     
-    def __init__(self, name, rating=DEFAULT_ELO, role="", team=""):
-        self.id = str(uuid.uuid4())
+    # Fixed attribute layout, no per-participant __dict__
+    __slots__ = ('id', 'name', 'rating', 'role', 'team', 'active',
+                 'matches_played', 'won', 'drawn', 'lost', 'points',
+                 'score_for', 'score_against', 'kills', 'deaths', 'mvp_count',
+                 'opponent_history')
+    
+    def __init__(self, name, rating=DEFAULT_ELO, role="", team="", participant_id=None):
+        self.id = participant_id or str(uuid.uuid4())
         self.name = name
         self.rating = rating
         self.role = role
@@ -43,12 +59,11 @@ class Participant:
         self.mvp_count = 0
         
         # For Swiss format (avoid playing same person twice)
-        self.opponent_history = []
+        self.opponent_history = set()
     
     def add_opponent(self, opponent_id):
         """Remember who you played against"""
-        if opponent_id not in self.opponent_history:
-            self.opponent_history.append(opponent_id)
+        self.opponent_history.add(opponent_id)
     
     def has_played(self, opponent_id):
         """Check if already played this person"""
@@ -83,7 +98,7 @@ class Participant:
             'kills': self.kills,
             'deaths': self.deaths,
             'mvp_count': self.mvp_count,
-            'opponent_history': self.opponent_history
+            'opponent_history': sorted(self.opponent_history)
         }
 
 
@@ -94,8 +109,12 @@ class Participant:
 class Match:
     """Stores single match data"""
     
-    def __init__(self, player1_id, player2_id, round_num):
-        self.id = str(uuid.uuid4())
+    # Fixed attribute layout, no per-match __dict__
+    __slots__ = ('id', 'player1_id', 'player2_id', 'round', 'played',
+                 'score1', 'score2', 'mvp_id', 'mvp_name')
+    
+    def __init__(self, player1_id, player2_id, round_num, match_id=None):
+        self.id = match_id or str(uuid.uuid4())
         self.player1_id = player1_id
         self.player2_id = player2_id  # None = BYE match
         self.round = round_num
@@ -143,20 +162,76 @@ class Tournament:
         self.created = datetime.now().strftime("%Y-%m-%d %H:%M")
         
         self.participants = {}  # ID -> Participant object
+        self.active_players = {}  # ID -> Participant still in the tournament
         self.matches = []       # List of Match objects
+        self.match_index = {}   # ID -> Match object
+        self.round_matches = {}  # Round number -> list of Match objects
+        self.unplayed_ids = set()  # IDs of matches still waiting for a result
+        self.played_count = 0   # Matches with a result
+        self.total_score = 0    # Both scores summed over played matches
+        
+        # Cached standings, rebuilt only after a change
+        self._standings = None
     
     def add_participant(self, participant):
         """Add player/team to tournament"""
         self.participants[participant.id] = participant
+        if participant.active:
+            self.active_players[participant.id] = participant
+        self.invalidate_standings()
+    
+    def next_participant_id(self):
+        """Short sequential ID for the next participant (unique within this tournament)"""
+        return f"P{len(self.participants) + 1}"
+    
+    def eliminate(self, participant):
+        """Knock a player/team out of the tournament"""
+        participant.active = False
+        self.active_players.pop(participant.id, None)
+        self.invalidate_standings()
+    
+    def add_match(self, match):
+        """Add match to tournament"""
+        self.matches.append(match)
+        self.match_index[match.id] = match
+        self.round_matches.setdefault(match.round, []).append(match)
+        if match.played:
+            self.played_count += 1
+            self.total_score += match.score1 + match.score2
+        else:
+            self.unplayed_ids.add(match.id)
+    
+    def mark_played(self, match, score1, score2):
+        """Store a match result and update the running totals"""
+        match.score1 = score1
+        match.score2 = score2
+        match.played = True
+        self.unplayed_ids.discard(match.id)
+        self.played_count += 1
+        self.total_score += score1 + score2
+        self.invalidate_standings()
+    
+    def next_match_id(self):
+        """Short sequential ID for the next match (unique within this tournament)"""
+        return f"M{len(self.matches) + 1}"
+    
+    def get_match(self, match_id):
+        """Find match by ID (None if not found)"""
+        return self.match_index.get(match_id)
+    
+    def invalidate_standings(self):
+        """Mark standings as stale (call after any result or roster change)"""
+        self._standings = None
     
     def get_active_participants(self):
         """Get all active players sorted by points"""
-        active = [p for p in self.participants.values() if p.active]
-        return sorted(active, key=lambda x: (x.points, x.get_score_diff(), x.rating), reverse=True)
+        if self._standings is None:
+            self._standings = sorted(self.active_players.values(), key=lambda x: (x.points, x.get_score_diff(), x.rating), reverse=True)
+        return list(self._standings)
     
     def get_current_matches(self):
         """Get matches for current round"""
-        return [m for m in self.matches if m.round == self.current_round]
+        return list(self.round_matches.get(self.current_round, []))
     
     def to_dict(self):
         """Convert to dictionary for saving"""
@@ -180,34 +255,143 @@ class Tournament:
 class DataStore:
     """Handles saving and loading tournaments"""
     
+    # Tournament ID -> encoded JSON from the last save (reused while unchanged)
+    _encoded = {}
+    
+    # Background writer: newest file contents waiting to be written
+    _pending = None
+    _writing = False
+    _writer = None
+    _last_error = None  # Message from the last failed write (None after a good one)
+    _cond = threading.Condition()
+    
+    # Previous save, kept as a fallback for load()
+    BACKUP_FILE = DATA_FILE.replace('.json', '_backup.json')
+    
+    @staticmethod
+    def _encode(data):
+        """Encode to indented JSON bytes (orjson when installed)"""
+        if orjson:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2).encode('utf-8')
+    
     @staticmethod
-    def save(tournaments):
+    def save(tournaments, changed=None):
         """Save all tournaments to JSON file"""
-        data = [t.to_dict() for t in tournaments.values()]
         
+        # Only tournaments in `changed` (or never saved) are re-encoded, None = all
+        cache = DataStore._encoded
+        for tid in list(cache):
+            if tid not in tournaments or changed is None or tid in changed:
+                del cache[tid]
+        
+        tid = None
+        try:
+            parts = []
+            for tid, t in tournaments.items():
+                if tid not in cache:
+                    cache[tid] = DataStore._encode(t.to_dict())
+                parts.append(cache[tid])
+            payload = b"[\n" + b",\n".join(parts) + b"\n]" if parts else b"[]"
+        except Exception as e:
+            # Never keep a half-done entry for the tournament that failed
+            cache.pop(tid, None)
+            print(f"Save error: {e}")
+            return False
+        
+        # Disk IO happens on the writer thread (a newer save replaces an unwritten one)
+        with DataStore._cond:
+            DataStore._pending = payload
+            if DataStore._writer is None:
+                atexit.register(DataStore.flush)  # never exit with a save still queued
+            if DataStore._writer is None or not DataStore._writer.is_alive():
+                # First save, or the last writer died: start a fresh one
+                DataStore._writer = threading.Thread(target=DataStore._write_loop, daemon=True)
+                DataStore._writer.start()
+            DataStore._cond.notify_all()
+            
+            # Report the last write's failure (this save is still queued and retries it)
+            return DataStore._last_error is None
+    
+    @staticmethod
+    def flush():
+        """Wait until every queued save has been written (returns the error, None if saved)"""
+        with DataStore._cond:
+            while DataStore._pending is not None or DataStore._writing:
+                DataStore._cond.wait()
+            return DataStore._last_error
+    
+    @staticmethod
+    def _write_loop():
+        """Writer thread: write the newest pending save, then wait for the next"""
+        while True:
+            with DataStore._cond:
+                while DataStore._pending is None:
+                    DataStore._cond.wait()
+                payload = DataStore._pending
+                DataStore._pending = None
+                DataStore._writing = True
+            
+            # Always clear the busy flag, or flush() would wait forever
+            error = "save writer stopped"
+            try:
+                error = DataStore._write_file(payload)
+            finally:
+                with DataStore._cond:
+                    DataStore._last_error = error
+                    DataStore._writing = False
+                    DataStore._cond.notify_all()
+    
+    @staticmethod
+    def _write_file(payload):
+        """Write encoded tournaments to the data file (returns the error, None if saved)"""
         try:
-            # Create backup first
+            # Write the new data (one JSON array of tournaments) to a temp file first,
+            # so a crash mid-write never leaves a half-written data file
+            tmp_name = DATA_FILE + '.tmp'
+            with open(tmp_name, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            # Copy the previous save to the backup (the data file itself stays in place)
             if os.path.exists(DATA_FILE):
-                backup_name = DATA_FILE.replace('.json', '_backup.json')
-                os.replace(DATA_FILE, backup_name)
+                backup_tmp = DataStore.BACKUP_FILE + '.tmp'
+                if os.path.exists(backup_tmp):
+                    os.remove(backup_tmp)
+                try:
+                    os.link(DATA_FILE, backup_tmp)  # hard link, no data copied
+                except OSError:
+                    shutil.copy2(DATA_FILE, backup_tmp)
+                os.replace(backup_tmp, DataStore.BACKUP_FILE)
             
-            # Save new data
-            with open(DATA_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
-            return True
+            # Swap the new file in with one atomic rename
+            os.replace(tmp_name, DATA_FILE)
+            return None
         except Exception as e:
             print(f"Save error: {e}")
-            return False
+            return str(e)
     
     @staticmethod
     def load():
-        """Load tournaments from JSON file"""
-        if not os.path.exists(DATA_FILE):
-            return {}
+        """Load tournaments from JSON file (falls back to the backup)"""
+        DataStore.flush()
         
+        # Missing or unreadable data file: the previous save is the next best thing
+        for path in (DATA_FILE, DataStore.BACKUP_FILE):
+            if os.path.exists(path):
+                tournaments = DataStore._read_file(path)
+                if tournaments is not None:
+                    return tournaments
+        return {}
+    
+    @staticmethod
+    def _read_file(path):
+        """Rebuild tournaments from one save file (None if it can't be parsed)"""
         try:
-            with open(DATA_FILE, 'r') as f:
-                data = json.load(f)
+            with open(path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
             
             tournaments = {}
             
@@ -219,15 +403,15 @@ class DataStore:
                 t.finished = item.get('finished', False)
                 t.created = item.get('created', '')
                 
-                # Recreate participants
+                # Recreate participants (IDs are interned so every reference shares one string)
                 for pid, pdata in item.get('participants', {}).items():
                     p = Participant(
                         pdata['name'],
                         pdata.get('rating', DEFAULT_ELO),
                         pdata.get('role', ''),
-                        pdata.get('team', '')
+                        pdata.get('team', ''),
+                        sys.intern(pdata['id'])
                     )
-                    p.id = pdata['id']
                     p.active = pdata.get('active', True)
                     p.matches_played = pdata.get('matches_played', 0)
                     p.won = pdata.get('won', 0)
@@ -239,24 +423,25 @@ class DataStore:
                     p.kills = pdata.get('kills', 0)
                     p.deaths = pdata.get('deaths', 0)
                     p.mvp_count = pdata.get('mvp_count', 0)
-                    p.opponent_history = pdata.get('opponent_history', [])
-                    t.participants[pid] = p
+                    p.opponent_history = {sys.intern(o) for o in pdata.get('opponent_history', [])}
+                    t.add_participant(p)
                 
                 # Recreate matches
                 for mdata in item.get('matches', []):
-                    m = Match(mdata['player1_id'], mdata.get('player2_id'), mdata['round'])
-                    m.id = mdata['id']
+                    p2_id = mdata.get('player2_id')
+                    m = Match(sys.intern(mdata['player1_id']), p2_id and sys.intern(p2_id), mdata['round'], mdata['id'])
                     m.played = mdata.get('played', False)
                     m.score1 = mdata.get('score1', 0)
                     m.score2 = mdata.get('score2', 0)
-                    m.mvp_id = mdata.get('mvp_id')
+                    mvp_id = mdata.get('mvp_id')
+                    m.mvp_id = mvp_id and sys.intern(mvp_id)
                     m.mvp_name = mdata.get('mvp_name', '')
-                    t.matches.append(m)
+                    t.add_match(m)
                 
                 tournaments[t.id] = t
             
             return tournaments
             
         except Exception as e:
-            print(f"Load error: {e}")
-            return {}
+            print(f"Load error ({path}): {e}")
+            return None
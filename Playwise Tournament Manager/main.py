@@ -20,7 +20,7 @@ from datetime import datetime
 import sys
 
 # Import all modules
-from config import WINDOW_WIDTH, WINDOW_HEIGHT, GAME_CONFIGS
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, GAME_CONFIGS, DEFAULT_ELO, MIN_PLAYERS
 from data_models import Tournament, Participant, DataStore
 from tournament_logic import TournamentEngine
 from analytics import LeaderboardSystem, AnalyticsEngine
@@ -114,8 +114,10 @@ class PlaywiseApp:
         self.root.mainloop()
     
     def save_data(self):
-        """Save all tournaments"""
-        DataStore.save(self.tournaments)
+        """Save all tournaments (only the current one is re-encoded)"""
+        changed = [self.current_tournament.id] if self.current_tournament else []
+        if not DataStore.save(self.tournaments, changed):
+            messagebox.showerror("Error", "Could not save tournaments")
     
     def on_close(self):
         """Handle window close"""
@@ -125,6 +127,11 @@ class PlaywiseApp:
             print(f"  Team: {self.team}")
             print("=" * 80)
             self.save_data()
+            
+            # Wait for the write to land so a failure can still be reported
+            error = DataStore.flush()
+            if error and not messagebox.askokcancel("Save Error", f"Could not save tournaments:\n{error}\n\nExit anyway?"):
+                return
             self.root.destroy()
     
     # ==========================================================================
@@ -142,16 +149,17 @@ class PlaywiseApp:
             for pdata in participants_data:
                 p = Participant(
                     pdata['name'],
-                    pdata.get('rating', 1000),
+                    pdata.get('rating', DEFAULT_ELO),
                     pdata.get('role', ''),
-                    pdata.get('team', '')
+                    pdata.get('team', ''),
+                    tournament.next_participant_id()
                 )
                 tournament.add_participant(p)
                 participant_list.append(p)
             
             # Validate
-            if len(tournament.participants) < 2:
-                return False, "Need at least 2 participants"
+            if len(tournament.participants) < MIN_PLAYERS:
+                return False, f"Need at least {MIN_PLAYERS} participants"
             
             # Check role constraints
             game_config = GAME_CONFIGS[game]
@@ -6,9 +6,9 @@
 ╚═══════════════════════════════════════════════════════════════════════════╝
 """
 
-import random
+from operator import attrgetter
 from data_models import Match
-from config import GAME_CONFIGS
+from config import SHOOTER_GAMES, DRAW_GAMES, SWISS_SEARCH_LIMIT
 
 
 # ==============================================================================
@@ -35,22 +35,61 @@ class TournamentEngine:
         
         # Sort based on format
         if tournament.format == "League":
-            # Round-robin: rotate players
-            random.shuffle(active)
+            # Round-robin: circle method, everyone meets everyone once per cycle
+            players = list(tournament.active_players.values())
+            active = TournamentEngine._circle_round(players, tournament.current_round)
         
         elif tournament.format == "Swiss":
             # Swiss: pair by points (already sorted)
             pass
         
         elif tournament.format == "Knockout":
-            # Knockout: seed by rating
-            active.sort(key=lambda x: x.rating, reverse=True)
+            # Knockout: seed by rating, best vs worst
+            active.sort(key=attrgetter('rating'), reverse=True)
+            active = TournamentEngine._seeded_order(active)
         
         # Create pairs
         TournamentEngine._create_pairs(tournament, active)
         
         return True
     
+    @staticmethod
+    def _circle_round(players, round_no):
+        """Order players so adjacent pairs form round-robin round N (BYE player last)"""
+        
+        # Player 0 stays put, the rest rotate one place per round
+        slots = players + [None] if len(players) % 2 else list(players)
+        n = len(slots)
+        shift = (round_no - 1) % (n - 1)
+        rest = slots[1:]
+        circle = [slots[0]] + rest[len(rest) - shift:] + rest[:len(rest) - shift]
+        
+        ordered = []
+        bye = None
+        for i in range(n // 2):
+            p1, p2 = circle[i], circle[n - 1 - i]
+            if p1 is None or p2 is None:
+                bye = p1 or p2
+            else:
+                ordered.extend((p1, p2))
+        
+        if bye:
+            ordered.append(bye)
+        return ordered
+    
+    @staticmethod
+    def _seeded_order(seeds):
+        """Order seeds so adjacent pairs are 1 vs N, 2 vs N-1, ... (top seed gets the BYE)"""
+        
+        bye = seeds[:len(seeds) % 2]
+        rest = seeds[len(bye):]
+        half = len(rest) // 2
+        
+        ordered = []
+        for p1, p2 in zip(rest[:half], reversed(rest[half:])):
+            ordered.extend((p1, p2))
+        return ordered + bye
+    
     @staticmethod
     def _create_pairs(tournament, players):
         """Create match pairings from player list"""
@@ -59,51 +98,134 @@ class TournamentEngine:
         
         # Swiss format: avoid rematches
         if tournament.format == "Swiss":
-            while len(pool) > 1:
-                p1 = pool.pop(0)
-                opponent = None
-                
-                # Find someone p1 hasn't played yet
-                for i, candidate in enumerate(pool):
-                    if not p1.has_played(candidate.id):
-                        opponent = pool.pop(i)
-                        break
-                
-                # If everyone already played, just pair anyway
-                if not opponent and pool:
-                    opponent = pool.pop(0)
-                
-                if opponent:
-                    match = Match(p1.id, opponent.id, tournament.current_round)
-                    tournament.matches.append(match)
-                    p1.add_opponent(opponent.id)
-                    opponent.add_opponent(p1.id)
+            pairs, bye = TournamentEngine._swiss_pairs(pool)
+            
+            for p1, p2 in pairs:
+                match = Match(p1.id, p2.id, tournament.current_round, tournament.next_match_id())
+                tournament.add_match(match)
+                p1.add_opponent(p2.id)
+                p2.add_opponent(p1.id)
+            
+            pool = [bye] if bye else []
         
         else:
-            # Standard pairing: pair adjacent players
-            while len(pool) > 1:
-                p1 = pool.pop(0)
-                p2 = pool.pop(0)
-                match = Match(p1.id, p2.id, tournament.current_round)
-                tournament.matches.append(match)
+            # Standard pairing: pair adjacent players (1v2, 3v4, ...)
+            for p1, p2 in zip(pool[0::2], pool[1::2]):
+                match = Match(p1.id, p2.id, tournament.current_round, tournament.next_match_id())
+                tournament.add_match(match)
+            
+            pool = pool[-1:] if len(pool) % 2 else []
         
         # Handle BYE (odd player)
         if pool:
-            bye_match = Match(pool[0].id, None, tournament.current_round)
-            tournament.matches.append(bye_match)
+            bye_match = Match(pool[0].id, None, tournament.current_round, tournament.next_match_id())
+            tournament.add_match(bye_match)
             # Auto-record BYE win
             TournamentEngine.record_result(tournament, bye_match.id, 1, 0)
     
+    @staticmethod
+    def _swiss_pairs(players):
+        """Pair players by standings, avoiding rematches when possible, returns (pairs, bye)"""
+        
+        # Search the whole field at once (the step budget bounds the time)
+        budget = [SWISS_SEARCH_LIMIT]
+        
+        # Odd count: try giving the BYE to the lowest ranked player first
+        bye_options = reversed(players) if len(players) % 2 else [None]
+        
+        for bye in bye_options:
+            pool = [p for p in players if p is not bye]
+            pairs = TournamentEngine._search_pairs(pool, budget)
+            if pairs is not None:
+                return pairs, bye
+            if budget[0] <= 0:
+                break
+        
+        # No rematch-free pairing found: fall back to greedy (may repeat opponents)
+        return TournamentEngine._greedy_swiss_pairs(players)
+    
+    @staticmethod
+    def _search_pairs(pool, budget):
+        """Backtracking search for a rematch-free pairing (None if impossible)"""
+        
+        # Work out each player's allowed opponents once, in standings order
+        n = len(pool)
+        options = [[j for j in range(i + 1, n) if not pool[i].has_played(pool[j].id)]
+                   for i in range(n)]
+        
+        # Someone with no possible opponent at all makes the search hopeless
+        reachable = [bool(opts) for opts in options]
+        for opts in options:
+            for j in opts:
+                reachable[j] = True
+        if not all(reachable):
+            return None
+        
+        paired = [False] * n
+        pairs = []
+        
+        def search(i):
+            # Skip to the next unpaired player
+            while i < n and paired[i]:
+                i += 1
+            if i == n:
+                return True
+            
+            budget[0] -= 1
+            if budget[0] <= 0:
+                return False
+            
+            paired[i] = True
+            for j in options[i]:
+                if paired[j]:
+                    continue
+                
+                paired[j] = True
+                pairs.append((pool[i], pool[j]))
+                if search(i + 1):
+                    return True
+                pairs.pop()
+                paired[j] = False
+                
+                if budget[0] <= 0:
+                    break
+            
+            paired[i] = False
+            return False
+        
+        return pairs if search(0) else None
+    
+    @staticmethod
+    def _greedy_swiss_pairs(players):
+        """Pair each player with the next one they haven't played yet"""
+        
+        pool = players.copy()
+        pairs = []
+        
+        while len(pool) > 1:
+            p1 = pool.pop(0)
+            opponent = None
+            
+            # Find someone p1 hasn't played yet
+            for i, candidate in enumerate(pool):
+                if not p1.has_played(candidate.id):
+                    opponent = pool.pop(i)
+                    break
+            
+            # If everyone already played, just pair anyway
+            if not opponent:
+                opponent = pool.pop(0)
+            
+            pairs.append((p1, opponent))
+        
+        return pairs, (pool[0] if pool else None)
+    
     @staticmethod
     def record_result(tournament, match_id, score1, score2):
         """Record match result and calculate MVP"""
         
         # Find match
-        match = None
-        for m in tournament.matches:
-            if m.id == match_id:
-                match = m
-                break
+        match = tournament.get_match(match_id)
         
         if not match or match.played:
             return False
@@ -113,20 +235,16 @@ class TournamentEngine:
             return False
         
         # Check draw rules
-        game_config = GAME_CONFIGS[tournament.game]
-        
         if score1 == score2:
             # Knockout NEVER allows draws
             if tournament.format == "Knockout":
                 return False
             # Check if game allows draws
-            if not game_config.get('allows_draw', True):
+            if tournament.game not in DRAW_GAMES:
                 return False
         
         # Update match
-        match.score1 = score1
-        match.score2 = score2
-        match.played = True
+        tournament.mark_played(match, score1, score2)
         
         # Get participants
         p1 = tournament.participants[match.player1_id]
@@ -141,8 +259,7 @@ class TournamentEngine:
         p2 = tournament.participants[match.player2_id]
         
         # NEW: Update K/D for shooters (Valorant, CS2, PUBG Mobile)
-        shooter_games = ["Valorant", "Counter-Strike 2", "PUBG Mobile"]
-        if tournament.game in shooter_games:
+        if tournament.game in SHOOTER_GAMES:
             p1.kills += score1
             p1.deaths += score2
             p2.kills += score2
@@ -156,40 +273,28 @@ class TournamentEngine:
         p2.score_for += score2
         p2.score_against += score1
         
-        # NEW: Calculate and assign MVP (highest score wins)
+        # Determine winner (winner also takes the MVP, no MVP on a draw)
         if score1 > score2:
-            match.mvp_id = p1.id
-            match.mvp_name = p1.name
-            p1.mvp_count += 1
+            winner, loser = p1, p2
         elif score2 > score1:
-            match.mvp_id = p2.id
-            match.mvp_name = p2.name
-            p2.mvp_count += 1
-        # If draw, no MVP
-        
-        # Determine winner
-        if score1 > score2:
-            # Player 1 wins
-            p1.won += 1
-            p2.lost += 1
-            p1.points += 1.0
-            if tournament.format == "Knockout":
-                p2.active = False  # Eliminate loser
-        
-        elif score2 > score1:
-            # Player 2 wins
-            p2.won += 1
-            p1.lost += 1
-            p2.points += 1.0
-            if tournament.format == "Knockout":
-                p1.active = False  # Eliminate loser
-        
+            winner, loser = p2, p1
         else:
             # Draw
             p1.drawn += 1
             p2.drawn += 1
             p1.points += 0.5
             p2.points += 0.5
+            return True
+        
+        winner.won += 1
+        loser.lost += 1
+        winner.points += 1.0
+        if tournament.format == "Knockout":
+            tournament.eliminate(loser)
+        
+        match.mvp_id = winner.id
+        match.mvp_name = winner.name
+        winner.mvp_count += 1
         
         return True
     
@@ -198,14 +303,12 @@ class TournamentEngine:
         """Move to next round"""
         
         # Check all matches are done
-        current = tournament.get_current_matches()
-        if not all(m.played for m in current):
+        if tournament.unplayed_ids:
             return False
         
         # Check if tournament should end
         if tournament.format == "Knockout":
-            active = tournament.get_active_participants()
-            if len(active) == 1:
+            if len(tournament.active_players) == 1:
                 tournament.finished = True
                 return True
         
@@ -10,7 +10,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import random
 
-from config import COLORS, GAME_CONFIGS, FORMATS, WINDOW_WIDTH, WINDOW_HEIGHT
+from config import COLORS, GAME_CONFIGS, DRAW_GAMES, FORMATS, MEDALS, WINDOW_WIDTH, WINDOW_HEIGHT
+from config import DEFAULT_ELO, MIN_PLAYERS, MAX_PLAYERS, SHEET_BATCH_ROWS
 from data_models import Participant
 from tournament_logic import TournamentEngine
 from analytics import LeaderboardSystem, AnalyticsEngine
@@ -27,6 +28,20 @@ class UIManager:
         self.root = root
         self.app = app
         self.sheet_entries = []
+        self.sheet_frame = None     # Frame and game the current sheet was built for
+        self.sheet_game = None
+        self.sheet_job = None       # Pending after_idle job while the sheet is built
+        
+        # Widgets reused when a result is recorded
+        self.match_cards = {}       # Match ID -> (card frame, Match)
+        self.leaderboard_tree = None
+        self.leaderboard_rows = {}  # Participant ID -> row values shown
+        self.leaderboard_order = []  # Participant IDs in the order shown
+        self.stats_tab = None
+        self.board_rows = {}        # Tree widget name -> row values shown
+        self.pending_tabs = {}      # Tab widget name -> (builder, tab frame)
+        self.refresh_pending = set()  # Tables waiting for a coalesced refresh
+        self.refresh_job = None
         
         self.setup_styles()
         self.create_layout()
@@ -77,6 +92,8 @@ class UIManager:
     
     def clear_main(self):
         """Clear main area"""
+        self.cancel_sheet_build()
+        self.cancel_refresh()
         for widget in self.main_area.winfo_children():
             widget.destroy()
     
@@ -114,9 +131,12 @@ class UIManager:
         tree.column("round", width=80)
         tree.column("status", width=100)
         
-        for t in self.app.tournaments.values():
-            status = "🏆 Finished" if t.finished else "⚡ Active"
-            tree.insert("", "end", values=(t.name, t.game, t.format, f"R{t.current_round}", status), iid=t.id)
+        # Build row values first so the insert loop is only Tk calls
+        rows = [(t.id, (t.name, t.game, t.format, f"R{t.current_round}",
+                        "🏆 Finished" if t.finished else "⚡ Active"))
+                for t in self.app.tournaments.values()]
+        for iid, values in rows:
+            tree.insert("", "end", values=values, iid=iid)
         
         tree.pack(fill="both", expand=True, pady=10)
         tree.bind("<Double-1>", lambda e: self.load_tournament(tree))
@@ -160,6 +180,8 @@ class UIManager:
     def show_create(self):
         """Show tournament creation form"""
         self.clear_main()
+        self.sheet_entries = []
+        self.sheet_frame = None
         
         tk.Label(self.main_area, text="Create New Tournament", font=("Arial", 20, "bold"),
                 bg=COLORS["bg_dark"], fg=COLORS["accent"]).pack(anchor="w", pady=20)
@@ -227,22 +249,34 @@ class UIManager:
     
     def generate_sheet(self, game_combo, count_entry, sheet_frame):
         """Generate player entry fields"""
-        for widget in sheet_frame.winfo_children():
-            widget.destroy()
-        self.sheet_entries = []
+        self.cancel_sheet_build()
         
-        try:
-            count = int(count_entry.get())
-            if count < 2 or count > 128:
-                messagebox.showwarning("Invalid", "Enter 2-128 players")
-                return
-        except:
+        count = self.parse_int(count_entry.get())
+        if count is None:
             messagebox.showerror("Error", "Enter valid number")
             return
+        if count < MIN_PLAYERS or count > MAX_PLAYERS:
+            messagebox.showwarning("Invalid", f"Enter {MIN_PLAYERS}-{MAX_PLAYERS} players")
+            return
         
         game = game_combo.get()
         config = GAME_CONFIGS[game]
         
+        # Same sheet and game: keep the rows already typed in, just add or drop rows
+        if sheet_frame is self.sheet_frame and game == self.sheet_game:
+            for row_data in self.sheet_entries[count:]:
+                for widget in row_data.values():
+                    widget.destroy()
+            del self.sheet_entries[count:]
+            self.build_sheet_rows(sheet_frame, config, len(self.sheet_entries), count)
+            return
+        
+        for widget in sheet_frame.winfo_children():
+            widget.destroy()
+        self.sheet_entries = []
+        self.sheet_frame = sheet_frame
+        self.sheet_game = game
+        
         # Headers
         headers = ["#", "Name"]
         if config['has_elo']:
@@ -255,11 +289,19 @@ class UIManager:
             tk.Label(sheet_frame, text=text, bg=COLORS["accent"], fg="white", 
                     font=("Arial", 9, "bold"), padx=10, pady=8).grid(row=0, column=col, sticky="ew", padx=1, pady=1)
         
-        # Entry rows
-        for i in range(count):
+        # Entry rows, built a batch at a time
+        self.build_sheet_rows(sheet_frame, config, 0, count)
+    
+    def build_sheet_rows(self, sheet_frame, config, start, count):
+        """Build one batch of player rows, then schedule the next"""
+        end = min(start + SHEET_BATCH_ROWS, count)
+        
+        for i in range(start, end):
             row_data = {}
             
-            tk.Label(sheet_frame, text=str(i+1), bg=COLORS["bg_card"], fg=COLORS["text_sub"], width=4).grid(row=i+1, column=0, padx=1, pady=1)
+            num = tk.Label(sheet_frame, text=str(i+1), bg=COLORS["bg_card"], fg=COLORS["text_sub"], width=4)
+            num.grid(row=i+1, column=0, padx=1, pady=1)
+            row_data['num'] = num
             
             col_idx = 1
             
@@ -270,7 +312,7 @@ class UIManager:
             
             if config['has_elo']:
                 e_elo = tk.Entry(sheet_frame, width=12, font=("Arial", 10))
-                e_elo.insert(0, "1000")
+                e_elo.insert(0, str(DEFAULT_ELO))
                 e_elo.grid(row=i+1, column=col_idx, padx=1, pady=1)
                 row_data['elo'] = e_elo
                 col_idx += 1
@@ -289,6 +331,33 @@ class UIManager:
                 col_idx += 1
             
             self.sheet_entries.append(row_data)
+        
+        if end < count:
+            self.sheet_job = self.root.after_idle(self.build_sheet_rows, sheet_frame, config, end, count)
+        else:
+            self.sheet_job = None
+    
+    @staticmethod
+    def parse_int(text):
+        """Read a whole number from entry text (None if it isn't one)"""
+        text = text.strip()
+        
+        # Overlong input can't be a sensible value (keeps it within 64 bits for saving)
+        if len(text) > 18:
+            return None
+        
+        # Plain digits are the common case: no exception handling needed
+        if text.isdecimal():
+            return int(text)
+        if text[:1] in ("+", "-") and text[1:].isdecimal():
+            return int(text)
+        return None
+    
+    def cancel_sheet_build(self):
+        """Stop building a player sheet that is no longer needed"""
+        if self.sheet_job:
+            self.root.after_cancel(self.sheet_job)
+            self.sheet_job = None
     
     def save_tournament(self, name_entry, game_combo, format_combo):
         """Create and save tournament"""
@@ -301,6 +370,10 @@ class UIManager:
             messagebox.showerror("Error", "Generate player sheet first")
             return
         
+        if self.sheet_job:
+            messagebox.showinfo("Please wait", "Player sheet is still loading")
+            return
+        
         # Collect participants
         participants = []
         for entry_row in self.sheet_entries:
@@ -309,7 +382,12 @@ class UIManager:
                 continue
             
             pdata = {'name': pname}
-            pdata['rating'] = int(entry_row['elo'].get()) if 'elo' in entry_row else 1000
+            pdata['rating'] = DEFAULT_ELO
+            if 'elo' in entry_row:
+                pdata['rating'] = self.parse_int(entry_row['elo'].get())
+                if pdata['rating'] is None:
+                    messagebox.showerror("Error", f"Enter a whole number Elo for {pname}")
+                    return
             pdata['team'] = entry_row['team'].get().strip() if 'team' in entry_row else ""
             pdata['role'] = entry_row['role'].get() if 'role' in entry_row else ""
             
@@ -350,20 +428,37 @@ class UIManager:
         tk.Label(self.main_area, text=info, bg=COLORS["accent"], fg="white",
                 font=("Arial", 11, "bold"), padx=15, pady=8).pack(anchor="w", pady=5)
         
-        # Tabs
+        # Tabs (contents are built the first time each tab is opened)
         notebook = ttk.Notebook(self.main_area)
         notebook.pack(fill="both", expand=True, pady=10)
         
-        self.create_leaderboard_tab(notebook, t)
-        self.create_matches_tab(notebook, t)
-        self.create_stats_tab(notebook, t)
+        self.leaderboard_tree = None
+        self.stats_tab = None
+        self.board_rows = {}
+        self.pending_tabs = {}
+        
+        tabs = [
+            ("🏆 Leaderboard", self.create_leaderboard_tab),
+            ("⚔️ Matches", self.create_matches_tab),
+            ("📊 Statistics", self.create_stats_tab)
+        ]
+        for text, builder in tabs:
+            tab = ttk.Frame(notebook)
+            notebook.add(tab, text=text)
+            self.pending_tabs[str(tab)] = (builder, tab)
+        
+        notebook.bind("<<NotebookTabChanged>>", lambda e: self.build_selected_tab(notebook, t))
+        self.build_selected_tab(notebook, t)
+    
+    def build_selected_tab(self, notebook, tournament):
+        """Build the selected tab if it hasn't been built yet"""
+        pending = self.pending_tabs.pop(notebook.select(), None)
+        if pending:
+            builder, tab = pending
+            builder(tab, tournament)
     
-    def create_leaderboard_tab(self, notebook, tournament):
+    def create_leaderboard_tab(self, tab, tournament):
         """Create leaderboard tab with MVP and K/D"""
-        tab = ttk.Frame(notebook)
-        notebook.add(tab, text="🏆 Leaderboard")
-        
-        leaderboard = LeaderboardSystem.get_leaderboard(tournament)
         config = GAME_CONFIGS[tournament.game]
         is_shooter = AnalyticsEngine.is_shooter_game(tournament.game)
         
@@ -423,7 +518,38 @@ class UIManager:
                 tree.column(c, width=60, anchor="center")
         
         # Data
-        for entry in leaderboard:
+        self.leaderboard_tree = tree
+        self.leaderboard_rows = {}
+        self.leaderboard_order = []
+        self.fill_leaderboard(tree, tournament)
+        
+        tree.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        tk.Button(tab, text="📤 Export CSV", command=self.export_csv,
+                 bg=COLORS["accent"], fg="white", font=("Arial", 10), padx=20, pady=8).pack(pady=10)
+    
+    def fill_leaderboard(self, tree, tournament):
+        """Fill leaderboard rows, only touching rows that changed"""
+        cols = tree["columns"]
+        is_shooter = "kd" in cols
+        has_elo = "elo" in cols
+        has_team = "team" in cols
+        leaderboard = LeaderboardSystem.get_leaderboard(tournament)
+        
+        # Drop rows for players no longer in the standings (knocked out)
+        current = {entry['id'] for entry in leaderboard}
+        gone = [iid for iid in self.leaderboard_rows if iid not in current]
+        if gone:
+            tree.delete(*gone)
+            for iid in gone:
+                del self.leaderboard_rows[iid]
+        
+        # Only move rows around if the ranking actually changed
+        order = [entry['id'] for entry in leaderboard]
+        shown = [iid for iid in self.leaderboard_order if iid in current]
+        reorder = shown != [iid for iid in order if iid in self.leaderboard_rows]
+        
+        for index, entry in enumerate(leaderboard):
             rank_text = f"{entry['medal']} {entry['rank']}" if entry['medal'] else entry['rank']
             
             vals = [rank_text, entry['name'], entry['played'], entry['won'], 
@@ -434,44 +560,37 @@ class UIManager:
             else:
                 vals.extend([entry['gf'], entry['ga'], entry['gd']])
             
-            if "elo" in cols:
+            if has_elo:
                 vals.insert(2, entry['rating'])
-            if "team" in cols:
+            if has_team:
                 vals.insert(2, entry['team'])
             
-            tree.insert("", "end", values=vals)
-        
-        tree.pack(fill="both", expand=True, padx=10, pady=10)
+            iid = entry['id']
+            if iid not in self.leaderboard_rows:
+                tree.insert("", index, iid=iid, values=vals)
+            else:
+                if self.leaderboard_rows[iid] != vals:
+                    tree.item(iid, values=vals)
+                if reorder:
+                    tree.move(iid, "", index)
+            self.leaderboard_rows[iid] = vals
         
-        tk.Button(tab, text="📤 Export CSV", command=self.export_csv,
-                 bg=COLORS["accent"], fg="white", font=("Arial", 10), padx=20, pady=8).pack(pady=10)
+        self.leaderboard_order = order
     
-    def create_stats_tab(self, notebook, tournament):
+    def create_stats_tab(self, tab, tournament):
         """Create statistics tab with MVP leaderboard"""
-        tab = ttk.Frame(notebook)
-        notebook.add(tab, text="📊 Statistics")
-        
-        # Tournament stats
-        stats = AnalyticsEngine.get_stats(tournament)
         is_shooter = AnalyticsEngine.is_shooter_game(tournament.game)
         
+        # Tournament stats
         stats_frame = tk.Frame(tab, bg=COLORS["bg_card"], padx=20, pady=15)
         stats_frame.pack(fill="x", padx=10, pady=10)
         
         tk.Label(stats_frame, text="Tournament Statistics", font=("Arial", 16, "bold"),
                 bg=COLORS["bg_card"], fg=COLORS["accent"]).pack(anchor="w", pady=(0, 10))
         
-        info_text = f"""
-📊 Total Matches: {stats['completed_matches']} / {stats['total_matches']}
-⏳ Pending: {stats['pending_matches']}
-⚽ Total Scores: {stats['total_goals']}
-📈 Average per Match: {stats['avg_goals']}
-⭐ MVP Matches: {stats['mvp_matches']}
-🏆 Tournament MVP: {stats['tournament_mvp']}
-        """
-        
-        tk.Label(stats_frame, text=info_text, font=("Arial", 11), bg=COLORS["bg_card"],
-                fg=COLORS["text_main"], justify="left").pack(anchor="w")
+        self.stats_info = tk.Label(stats_frame, font=("Arial", 11), bg=COLORS["bg_card"],
+                                   fg=COLORS["text_main"], justify="left")
+        self.stats_info.pack(anchor="w")
         
         # MVP Leaderboard
         mvp_frame = tk.Frame(tab, bg=COLORS["bg_card"], padx=20, pady=15)
@@ -480,36 +599,26 @@ class UIManager:
         tk.Label(mvp_frame, text="⭐ MVP Leaderboard", font=("Arial", 14, "bold"),
                 bg=COLORS["bg_card"], fg=COLORS["gold"]).pack(pady=(0, 10))
         
-        mvp_board = LeaderboardSystem.get_mvp_leaderboard(tournament)
+        mvp_cols = ("rank", "name", "team", "mvps", "matches")
+        self.mvp_tree = ttk.Treeview(mvp_frame, columns=mvp_cols, show="headings", height=10)
         
-        if mvp_board:
-            mvp_cols = ("rank", "name", "team", "mvps", "matches")
-            mvp_tree = ttk.Treeview(mvp_frame, columns=mvp_cols, show="headings", height=10)
-            
-            mvp_tree.heading("rank", text="Rank")
-            mvp_tree.heading("name", text="Player")
-            mvp_tree.heading("team", text="Team")
-            mvp_tree.heading("mvps", text="⭐ MVP Awards")
-            mvp_tree.heading("matches", text="Matches")
-            
-            mvp_tree.column("rank", width=60, anchor="center")
-            mvp_tree.column("name", width=200, anchor="w")
-            mvp_tree.column("team", width=150, anchor="center")
-            mvp_tree.column("mvps", width=120, anchor="center")
-            mvp_tree.column("matches", width=100, anchor="center")
-            
-            for entry in mvp_board:
-                mvp_tree.insert("", "end", values=(
-                    entry['rank'], entry['name'], entry['team'], 
-                    entry['mvp_count'], entry['matches']
-                ))
-            
-            mvp_tree.pack(fill="both", expand=True)
-        else:
-            tk.Label(mvp_frame, text="No MVP data yet. Play some matches!",
-                    bg=COLORS["bg_card"], fg=COLORS["text_sub"], font=("Arial", 11)).pack(pady=20)
+        self.mvp_tree.heading("rank", text="Rank")
+        self.mvp_tree.heading("name", text="Player")
+        self.mvp_tree.heading("team", text="Team")
+        self.mvp_tree.heading("mvps", text="⭐ MVP Awards")
+        self.mvp_tree.heading("matches", text="Matches")
+        
+        self.mvp_tree.column("rank", width=60, anchor="center")
+        self.mvp_tree.column("name", width=200, anchor="w")
+        self.mvp_tree.column("team", width=150, anchor="center")
+        self.mvp_tree.column("mvps", width=120, anchor="center")
+        self.mvp_tree.column("matches", width=100, anchor="center")
+        
+        self.mvp_empty = tk.Label(mvp_frame, text="No MVP data yet. Play some matches!",
+                                  bg=COLORS["bg_card"], fg=COLORS["text_sub"], font=("Arial", 11))
         
         # K/D Leaderboard for shooters
+        self.kd_tree = None
         if is_shooter:
             kd_frame = tk.Frame(tab, bg=COLORS["bg_card"], padx=20, pady=15)
             kd_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -517,39 +626,84 @@ class UIManager:
             tk.Label(kd_frame, text="🎯 K/D Leaderboard", font=("Arial", 14, "bold"),
                     bg=COLORS["bg_card"], fg=COLORS["success"]).pack(pady=(0, 10))
             
+            kd_cols = ("rank", "name", "team", "kills", "deaths", "kd")
+            self.kd_tree = ttk.Treeview(kd_frame, columns=kd_cols, show="headings", height=10)
+            
+            self.kd_tree.heading("rank", text="Rank")
+            self.kd_tree.heading("name", text="Player")
+            self.kd_tree.heading("team", text="Team")
+            self.kd_tree.heading("kills", text="Kills")
+            self.kd_tree.heading("deaths", text="Deaths")
+            self.kd_tree.heading("kd", text="K/D Ratio")
+            
+            self.kd_tree.column("rank", width=60, anchor="center")
+            self.kd_tree.column("name", width=200, anchor="w")
+            self.kd_tree.column("team", width=150, anchor="center")
+            self.kd_tree.column("kills", width=100, anchor="center")
+            self.kd_tree.column("deaths", width=100, anchor="center")
+            self.kd_tree.column("kd", width=100, anchor="center")
+        
+        self.stats_tab = tab
+        self.board_rows = {}
+        self.fill_stats_tab(tournament)
+    
+    def fill_stats_tab(self, tournament):
+        """Refresh statistics tab contents (widgets are built once)"""
+        stats = AnalyticsEngine.get_stats(tournament)
+        
+        info_text = f"""
+📊 Total Matches: {stats['completed_matches']} / {stats['total_matches']}
+⏳ Pending: {stats['pending_matches']}
+⚽ Total Scores: {stats['total_goals']}
+📈 Average per Match: {stats['avg_goals']}
+⭐ MVP Matches: {stats['mvp_matches']}
+🏆 Tournament MVP: {stats['tournament_mvp']}
+        """
+        self.stats_info.config(text=info_text)
+        
+        # MVP Leaderboard
+        mvp_board = LeaderboardSystem.get_mvp_leaderboard(tournament)
+        rows = [(e['rank'], e['name'], e['team'], e['mvp_count'], e['matches'])
+                for e in mvp_board]
+        self.update_rows(self.mvp_tree, rows)
+        
+        if mvp_board:
+            self.mvp_empty.pack_forget()
+            self.mvp_tree.pack(fill="both", expand=True)
+        else:
+            self.mvp_tree.pack_forget()
+            self.mvp_empty.pack(pady=20)
+        
+        # K/D Leaderboard for shooters
+        if self.kd_tree:
             kd_board = LeaderboardSystem.get_kd_leaderboard(tournament)
+            rows = [(e['rank'], e['name'], e['team'], e['kills'], e['deaths'], e['kd'])
+                    for e in kd_board]
+            self.update_rows(self.kd_tree, rows)
             
             if kd_board:
-                kd_cols = ("rank", "name", "team", "kills", "deaths", "kd")
-                kd_tree = ttk.Treeview(kd_frame, columns=kd_cols, show="headings", height=10)
-                
-                kd_tree.heading("rank", text="Rank")
-                kd_tree.heading("name", text="Player")
-                kd_tree.heading("team", text="Team")
-                kd_tree.heading("kills", text="Kills")
-                kd_tree.heading("deaths", text="Deaths")
-                kd_tree.heading("kd", text="K/D Ratio")
-                
-                kd_tree.column("rank", width=60, anchor="center")
-                kd_tree.column("name", width=200, anchor="w")
-                kd_tree.column("team", width=150, anchor="center")
-                kd_tree.column("kills", width=100, anchor="center")
-                kd_tree.column("deaths", width=100, anchor="center")
-                kd_tree.column("kd", width=100, anchor="center")
-                
-                for entry in kd_board:
-                    kd_tree.insert("", "end", values=(
-                        entry['rank'], entry['name'], entry['team'],
-                        entry['kills'], entry['deaths'], entry['kd']
-                    ))
-                
-                kd_tree.pack(fill="both", expand=True)
+                self.kd_tree.pack(fill="both", expand=True)
+            else:
+                self.kd_tree.pack_forget()
     
-    def create_matches_tab(self, notebook, tournament):
-        """Create matches tab"""
-        tab = ttk.Frame(notebook)
-        notebook.add(tab, text="⚔️ Matches")
+    def update_rows(self, tree, rows):
+        """Update a ranked table in place, only rewriting rows that changed"""
+        shown = self.board_rows.get(str(tree), [])
+        children = tree.get_children()
+        
+        for i, values in enumerate(rows):
+            if i >= len(children):
+                tree.insert("", "end", values=values)
+            elif shown[i] != values:
+                tree.item(children[i], values=values)
+        
+        if len(children) > len(rows):
+            tree.delete(*children[len(rows):])
         
+        self.board_rows[str(tree)] = rows
+    
+    def create_matches_tab(self, tab, tournament):
+        """Create matches tab"""
         # Toolbar
         toolbar = ttk.Frame(tab)
         toolbar.pack(fill="x", padx=10, pady=10)
@@ -578,6 +732,7 @@ class UIManager:
         scroll.pack(side="right", fill="y")
         
         matches = tournament.get_current_matches()
+        self.match_cards = {}
         
         if not matches:
             tk.Label(frame, text="No matches. Click 'Generate Fixtures'", 
@@ -592,6 +747,14 @@ class UIManager:
         card = tk.Frame(parent, bg=COLORS["bg_card"], padx=15, pady=12)
         card.pack(fill="x", pady=5, padx=10)
         
+        self.match_cards[match.id] = (card, match)
+        self.fill_match_card(card, match, tournament)
+    
+    def fill_match_card(self, card, match, tournament):
+        """Fill card contents (re-run in place when a result is recorded)"""
+        for widget in card.winfo_children():
+            widget.destroy()
+        
         p1 = tournament.participants[match.player1_id]
         p2_name = tournament.participants[match.player2_id].name if match.player2_id else "🎁 BYE"
         
@@ -619,20 +782,56 @@ class UIManager:
             tk.Button(btn_frame, text="P2 Win", command=lambda: self.record_result(match.id, 0, 1),
                      bg=COLORS["danger"], fg="white", font=("Arial", 9), padx=12, pady=6).pack(side="left", padx=2)
             
-            config = GAME_CONFIGS[tournament.game]
-            if config['allows_draw'] and tournament.format != "Knockout":
+            if tournament.game in DRAW_GAMES and tournament.format != "Knockout":
                 tk.Button(btn_frame, text="Draw", command=lambda: self.record_result(match.id, 1, 1),
                          bg=COLORS["warning"], fg="black", font=("Arial", 9), padx=12, pady=6).pack(side="left", padx=2)
     
     def record_result(self, match_id, score1, score2):
         """Record match result"""
-        success = TournamentEngine.record_result(self.app.current_tournament, match_id, score1, score2)
+        t = self.app.current_tournament
+        success = TournamentEngine.record_result(t, match_id, score1, score2)
         if success:
             self.app.save_data()
-            self.show_manage()
+            
+            # Update existing widgets instead of rebuilding the screen
+            card, match = self.match_cards[match_id]
+            self.fill_match_card(card, match, t)
+            
+            # Tabs not opened yet will be built with fresh data
+            if self.leaderboard_tree:
+                self.schedule_refresh("leaderboard")
+            if self.stats_tab:
+                self.schedule_refresh("stats")
         else:
             messagebox.showerror("Error", "Cannot record result")
     
+    def schedule_refresh(self, kind):
+        """Queue a table refresh (results entered in quick succession share one redraw)"""
+        self.refresh_pending.add(kind)
+        if self.refresh_job is None:
+            self.refresh_job = self.root.after(16, self.flush_refresh)
+    
+    def flush_refresh(self):
+        """Run the queued table refreshes"""
+        self.refresh_job = None
+        pending, self.refresh_pending = self.refresh_pending, set()
+        
+        t = self.app.current_tournament
+        if not t:
+            return
+        
+        if "leaderboard" in pending and self.leaderboard_tree:
+            self.fill_leaderboard(self.leaderboard_tree, t)
+        if "stats" in pending and self.stats_tab:
+            self.fill_stats_tab(t)
+    
+    def cancel_refresh(self):
+        """Drop queued refreshes for tables that are about to be destroyed"""
+        if self.refresh_job:
+            self.root.after_cancel(self.refresh_job)
+            self.refresh_job = None
+        self.refresh_pending.clear()
+    
     # ==========================================================================
     # VICTORY SCREEN
     # ==========================================================================
@@ -678,7 +877,7 @@ class UIManager:
             card = tk.Frame(podium_frame, bg=COLORS["bg_card"], padx=20, pady=15)
             card.pack(side="left", padx=15)
             
-            medal = {1: "🥇", 2: "🥈", 3: "🥉"}[i]
+            medal = MEDALS[i]
             tk.Label(card, text=medal, font=("Arial", 48), bg=COLORS["bg_card"]).pack()
             tk.Label(card, text=f"#{i}", font=("Arial", 16), bg=COLORS["bg_card"], 
                     fg=medal_colors[i]).pack()